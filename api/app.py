@@ -3,6 +3,7 @@ Clean FastAPI server for the Verbatim RAG system.
 Decoupled from RAG logic with proper dependency injection.
 """
 
+import json
 import logging
 import os
 import sys
@@ -14,6 +15,11 @@ from fastapi.middleware.cors import CORSMiddleware
 from fastapi.responses import StreamingResponse as FastAPIStreamingResponse
 from pydantic import BaseModel, Field
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 # Check for OpenAI API key
 if "OPENAI_API_KEY" not in os.environ:
     print("Warning: OPENAI_API_KEY environment variable not set.")
@@ -46,6 +52,13 @@ logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
 
+def _encode_ndjson(payload: dict) -> bytes:
+    """Encode one NDJSON line, using orjson when it is installed."""
+    if orjson is not None:
+        return orjson.dumps(payload, option=orjson.OPT_NON_STR_KEYS) + b"\n"
+    return (json.dumps(payload) + "\n").encode()
+
+
 # Request/Response models
 class QueryRequestModel(BaseModel):
     question: str
@@ -323,8 +336,6 @@ async def query_stream_endpoint(
 
         async def generate_clean_response():
             """Clean response generator using the package's streaming interface"""
-            import json
-
             logger.info(f"Starting streaming query for: {request.question}")
 
             try:
@@ -336,19 +347,16 @@ async def query_stream_endpoint(
                     logger.info(
                         f"Yielding stage {stage_count}: {stage.get('type', 'unknown')}"
                     )
-                    yield json.dumps(stage) + "\n"
+                    yield _encode_ndjson(stage)
 
                 if stage_count == 0:
                     logger.warning("No stages yielded from streaming query")
-                    yield (
-                        json.dumps(
-                            {
-                                "type": "error",
-                                "error": "No data returned from RAG system",
-                                "done": True,
-                            }
-                        )
-                        + "\n"
+                    yield _encode_ndjson(
+                        {
+                            "type": "error",
+                            "error": "No data returned from RAG system",
+                            "done": True,
+                        }
                     )
 
             except Exception as e:
@@ -356,9 +364,7 @@ async def query_stream_endpoint(
                 import traceback
 
                 traceback.print_exc()
-                yield (
-                    json.dumps({"type": "error", "error": str(e), "done": True}) + "\n"
-                )
+                yield _encode_ndjson({"type": "error", "error": str(e), "done": True})
 
         # Return streaming response with proper headers
         return FastAPIStreamingResponse(
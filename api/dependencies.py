@@ -30,7 +30,10 @@ def get_rag_instance(config: Annotated[APIConfig, Depends(get_config)]) -> Verba
         try:
             from verbatim_rag.index import VerbatimIndex
             from verbatim_rag.vector_stores import LocalMilvusStore
-            from verbatim_rag.embedding_providers import SpladeProvider
+            from verbatim_rag.embedding_providers import (
+                QuantizedSparseProvider,
+                SpladeProvider,
+            )
 
             llm_client = LLMClient(
                 model="gpt-4o-mini",
@@ -42,10 +45,12 @@ def get_rag_instance(config: Annotated[APIConfig, Depends(get_config)]) -> Verba
             )
 
 
-            # Create providers
-            sparse_provider = SpladeProvider(
-                model_name="opensearch-project/opensearch-neural-sparse-encoding-doc-v3-distill",
-                device="cpu",
+            # Create providers (quantized the same way as in ingest_docs.py)
+            sparse_provider = QuantizedSparseProvider(
+                SpladeProvider(
+                    model_name="opensearch-project/opensearch-neural-sparse-encoding-doc-v3-distill",
+                    device="cpu",
+                )
             )
 
             # Create vector store
@@ -54,6 +59,8 @@ def get_rag_instance(config: Annotated[APIConfig, Depends(get_config)]) -> Verba
                 collection_name="verbatim_rag",
                 enable_dense=False,
                 enable_sparse=True,
+                # must match ingest_docs.get_index() once dense is enabled
+                dense_quantization="binary",
             )
 
             # Create index
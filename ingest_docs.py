@@ -1,24 +1,96 @@
+import argparse
+import gc
+import json
+import multiprocessing
+import os
+import re
+import threading
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor, as_completed
 from pathlib import Path
+from typing import Literal
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
 
 from verbatim_rag import VerbatimIndex
 from verbatim_rag.ingestion import DocumentProcessor
+from verbatim_rag.ingestion.document_processor import file_sha256
 from verbatim_rag.vector_stores import LocalMilvusStore
-from verbatim_rag.embedding_providers import SpladeProvider
+from verbatim_rag.embedding_providers import QuantizedSparseProvider, SpladeProvider
 
 DOCS_DIR = Path("my_docs")          # <- just drop PDFs here
-STATE_FILE = Path("ingested_files.txt")  # remembers what was already ingested
+STATE_FILE = Path("ingested_files.json")  # sha256 -> filename already ingested
+LEGACY_STATE_FILE = Path("ingested_files.txt")  # old filename-only tracker
+CACHE_DIR = Path(".verbatim_cache")  # converted PDF text, keyed by content hash
+# Each worker holds its own DocumentProcessor (docling converter + models) for
+# the whole run, so peak memory grows with this cap, not just with BATCH_SIZE
+MAX_WORKERS = min(4, os.cpu_count() or 4)
+BATCH_SIZE = 8  # files parsed + indexed before the state file is checkpointed
+
+# One DocumentProcessor per worker thread/process; docling converters are not
+# safe to share across threads.
+_worker = threading.local()
+
+
+def _dumps_state(state: dict[str, str]) -> bytes:
+    if orjson is not None:
+        return orjson.dumps(state, option=orjson.OPT_INDENT_2)
+    return json.dumps(state, indent=2).encode()
+
+
+def _loads_state(data: bytes) -> dict[str, str]:
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
 
+def _load_state() -> dict[str, str]:
+    """Load the digest -> filename map, seeding it from the legacy txt tracker."""
+    if STATE_FILE.exists():
+        return _loads_state(STATE_FILE.read_bytes())
 
-def get_index():
+    state = {}
+    if LEGACY_STATE_FILE.exists():
+        legacy_names = {
+            line.strip()
+            for line in LEGACY_STATE_FILE.read_text().splitlines()
+            if line.strip()
+        }
+        for name in legacy_names:
+            path = DOCS_DIR / name
+            if path.is_file():
+                state[file_sha256(path)] = name
+    return state
+
+
+def _save_state(state: dict[str, str]) -> None:
+    """Durably replace the state file (write temp file, fsync, rename)."""
+    tmp = STATE_FILE.with_name(STATE_FILE.name + ".tmp")
+    with tmp.open("wb") as f:
+        f.write(_dumps_state(state))
+        f.flush()
+        os.fsync(f.fileno())
+    os.replace(tmp, STATE_FILE)
+
+
+def get_index(dense_quantization: Literal["fp32", "binary"] = "binary"):
+    # dense_quantization only takes effect if enable_dense is switched on;
+    # api/dependencies.py must open the store with the same setting
     vector_store = LocalMilvusStore(
         db_path="./index.db",          # must match api/app.py
         collection_name="verbatim_rag",
         enable_sparse=True,
         enable_dense=False,
+        dense_quantization=dense_quantization,
     )
-    sparse_provider = SpladeProvider(
-        model_name="opensearch-project/opensearch-neural-sparse-encoding-doc-v3-distill",
-        device="cpu",
+    # uint8-quantize SPLADE weights; near-zero terms are pruned from the index
+    sparse_provider = QuantizedSparseProvider(
+        SpladeProvider(
+            model_name="opensearch-project/opensearch-neural-sparse-encoding-doc-v3-distill",
+            device="cpu",
+        )
     )
     return VerbatimIndex(
         vector_store=vector_store,
@@ -26,20 +98,68 @@ def get_index():
     )
 
 
+def _init_worker():
+    _worker.processor = DocumentProcessor(cache_dir=CACHE_DIR)
+
+
+def _preview(text: str, n_words: int = 100) -> tuple[int, str]:
+    """Word count and first n_words, without materializing a list of all words."""
+    total_words = sum(1 for _ in re.finditer(r"\S+", text))
+    preview_words = " ".join(text.split(maxsplit=n_words)[:n_words])
+    return total_words, preview_words
+
+
+def _process(path: Path, digest: str):
+    """Parse one PDF; returns (path, doc, word count, preview) for the main thread."""
+    processor = getattr(_worker, "processor", None)
+    if processor is None:
+        _init_worker()
+        processor = _worker.processor
+    doc = processor.process_file(
+        file_path=str(path),
+        title=path.stem,
+        metadata={"source": "my_docs", "filename": path.name},
+        digest=digest,  # already hashed for dedup; reuse as the cache key
+    )
+    # Try common attribute names; fall back to empty string if missing
+    text = getattr(doc, "raw_content", "") or getattr(doc, "text", "")
+    total_words, preview_words = _preview(text)
+    return path, doc, total_words, preview_words
+
+
 def main():
-    DOCS_DIR.mkdir(exist_ok=True)
+    parser = argparse.ArgumentParser(description="Ingest new PDFs from my_docs/")
+    parser.add_argument(
+        "--processes",
+        action="store_true",
+        help="Parse PDFs in worker processes instead of threads "
+        "(for parsers that hold the GIL)",
+    )
+    args = parser.parse_args()
 
-    # Load list of already-ingested files (to avoid duplicates)
-    already = set()
-    if STATE_FILE.exists():
-        already = {
-            line.strip()
-            for line in STATE_FILE.read_text().splitlines()
-            if line.strip()
-        }
+    DOCS_DIR.mkdir(exist_ok=True)
 
-    pdf_paths = sorted(DOCS_DIR.glob("*.pdf"))
-    new_files = [p for p in pdf_paths if p.name not in already]
+    # Load content hashes of already-ingested files (to avoid duplicates,
+    # including renamed copies of the same PDF)
+    state = _load_state()
+
+    with os.scandir(DOCS_DIR) as it:
+        pdf_names = [
+            e.name for e in it if e.is_file() and e.name.lower().endswith(".pdf")
+        ]
+    pdf_names.sort()
+
+    new_files = []
+    digests = {}
+    seen = set()
+    for name in pdf_names:
+        p = DOCS_DIR / name
+        digest = file_sha256(p)
+        if digest in state or digest in seen:
+            continue
+        seen.add(digest)
+        digests[p] = digest
+        new_files.append(p)
 
     if not new_files:
         print("No new PDFs to ingest in my_docs/.")
@@ -47,42 +167,66 @@ def main():
 
     print(f"Found {len(new_files)} new PDF(s) in my_docs/")
 
-    processor = DocumentProcessor()
     index = get_index()
-
-    docs = []
-    for path in new_files:
-        print(f"\nProcessing {path.name} ...")
-        doc = processor.process_file(
-            file_path=str(path),
-            title=path.stem,
-            metadata={"source": "my_docs", "filename": path.name},
+    # Objects alive now (models, index client) live for the whole run; keep the
+    # per-batch gc.collect() from rescanning them
+    gc.freeze()
+
+    # Parse PDFs concurrently; all printing happens here in the main thread.
+    # Work in batches and checkpoint the state file after each one, so a crash
+    # mid-ingest doesn't re-embed files that already made it into the index.
+    max_workers = min(MAX_WORKERS, len(new_files))
+    if args.processes:
+        # Spawn rather than fork: by now this process has loaded torch (SPLADE)
+        # and opened the Milvus Lite gRPC client, and forking after either has
+        # initialized its threads can hang the children
+        executor = ProcessPoolExecutor(
+            max_workers=max_workers,
+            initializer=_init_worker,
+            mp_context=multiprocessing.get_context("spawn"),
         )
-
-        # --- Preview: first 100 words of extracted text ---
-        # Try common attribute names; fall back to empty string if missing
-        text = getattr(doc, "raw_content", "") or getattr(doc, "text", "")
-        if not text:
-            print("  [WARNING] No text extracted from this document.")
-        else:
-            words = text.split()
-            total_words = len(words)
-            preview_words = " ".join(words[:100])
-            print(f"  Extracted ~{total_words} words.")
-            print("  Preview (first 100 words):")
-            print("  " + preview_words)
-        print("-" * 80)
-        # -------------------------------------------------
-
-        docs.append(doc)
-
-    print(f"\nIndexing {len(docs)} document(s) into index.db ...")
-    index.add_documents(docs)
-
-    # Update state file
-    with STATE_FILE.open("a") as f:
-        for p in new_files:
-            f.write(p.name + "\n")
+    else:
+        executor = ThreadPoolExecutor(max_workers=max_workers, initializer=_init_worker)
+    with executor as ex:
+        for batch_start in range(0, len(new_files), BATCH_SIZE):
+            batch = new_files[batch_start : batch_start + BATCH_SIZE]
+            parsed = {}
+            futures = {ex.submit(_process, p, digests[p]): p for p in batch}
+            for future in as_completed(futures):
+                path, doc, total_words, preview_words = future.result()
+                print(f"\nProcessed {path.name}")
+
+                # --- Preview: first 100 words of extracted text ---
+                if not total_words:
+                    print("  [WARNING] No text extracted from this document.")
+                else:
+                    print(f"  Extracted ~{total_words} words.")
+                    print("  Preview (first 100 words):")
+                    print("  " + preview_words)
+                print("-" * 80)
+                # -------------------------------------------------
+
+                parsed[path] = doc
+
+            # Keep index insertion order stable regardless of completion order.
+            # Indexing stays on the main thread: Milvus Lite is not thread-safe.
+            docs = [parsed[p] for p in batch]
+
+            done = batch_start + len(batch)
+            print(
+                f"\nIndexing {len(docs)} document(s) into index.db "
+                f"({done}/{len(new_files)}) ..."
+            )
+            index.add_documents(docs)
+
+            # Checkpoint state file
+            for p in batch:
+                state[digests[p]] = p.name
+            _save_state(state)
+
+            # Only one batch of parsed documents is ever held in memory
+            del docs, parsed, futures
+            gc.collect()
 
     print("Done! New documents added to index.db")
 
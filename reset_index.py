@@ -3,7 +3,8 @@ import shutil
 import os
 
 DB_PATH = Path("index.db")
-STATE_FILE = Path("ingested_files.txt")
+STATE_FILE = Path("ingested_files.json")
+LEGACY_STATE_FILE = Path("ingested_files.txt")
 
 # Remove the Milvus Lite index: can be either a file or a directory
 if DB_PATH.exists():
@@ -14,9 +15,10 @@ if DB_PATH.exists():
         DB_PATH.unlink()
         print("Removed index.db file")
 
-# Remove the ingested-files tracker
-if STATE_FILE.exists():
-    STATE_FILE.unlink()
-    print("Removed ingested_files.txt")
+# Remove the ingested-files trackers (hash-based and legacy filename list)
+for state_file in (STATE_FILE, LEGACY_STATE_FILE):
+    if state_file.exists():
+        state_file.unlink()
+        print(f"Removed {state_file}")
 
 print("Index reset. Next ingest_docs.py run will build a new index from my_docs/.")
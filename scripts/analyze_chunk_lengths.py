@@ -7,7 +7,8 @@ Usage:
 from __future__ import annotations
 
 import argparse
-from statistics import mean
+
+import numpy as np
 
 from verbatim_rag.ingestion.document_processor import DocumentProcessor
 
@@ -15,26 +16,49 @@ from verbatim_rag.ingestion.document_processor import DocumentProcessor
 def summarize(lengths: list[int]) -> str:
     if not lengths:
         return "no chunks"
-    p95_idx = max(0, int(0.95 * len(lengths)) - 1)
-    ordered = sorted(lengths)
+    arr = np.asarray(lengths)
+    n = arr.size
+    p95_idx = max(0, int(0.95 * n) - 1)
+    # Linear-time selection of the order statistics instead of a full sort
+    selected = np.partition(arr, (n // 2, p95_idx))
     return (
-        f"count={len(lengths)}, min={ordered[0]}, median={ordered[len(ordered)//2]}, "
-        f"p95={ordered[p95_idx]}, max={ordered[-1]}, avg={mean(lengths):.1f}"
+        f"count={n}, min={arr.min()}, median={selected[n // 2]}, "
+        f"p95={selected[p95_idx]}, max={arr.max()}, avg={arr.mean():.1f}"
     )
 
 
+def top_longest(lengths: list[int], count: int = 10) -> list[tuple[int, int]]:
+    """Return (chunk index, length) pairs for the longest chunks, longest first."""
+    arr = np.asarray(lengths)
+    if arr.size > count:
+        # Select everything at or above the count-th largest length, then sort
+        # only those candidates (ties keep the lower chunk index first)
+        threshold = np.partition(arr, -count)[-count]
+        candidates = np.flatnonzero(arr >= threshold)
+    else:
+        candidates = np.arange(arr.size)
+    ordered = sorted(candidates.tolist(), key=lambda i: (-arr[i], i))[:count]
+    return [(i, int(arr[i])) for i in ordered]
+
+
 def main() -> None:
     parser = argparse.ArgumentParser()
     parser.add_argument("file")
+    parser.add_argument(
+        "--cache-dir",
+        default=".verbatim_cache",
+        help="Cache converted text here so reruns skip PDF parsing",
+    )
+    parser.add_argument("--no-cache", action="store_true")
     args = parser.parse_args()
 
-    processor = DocumentProcessor()
+    processor = DocumentProcessor(cache_dir=None if args.no_cache else args.cache_dir)
     document = processor.process_file(args.file)
 
     lengths = [len(c.content) for c in document.chunks]
     print("Chunk length summary:", summarize(lengths))
 
-    top = sorted(enumerate(lengths), key=lambda x: x[1], reverse=True)[:10]
+    top = top_longest(lengths)
     print("Top longest chunks:")
     for idx, length in top:
         print(f"  chunk#{idx}: {length} chars")
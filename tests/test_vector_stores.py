@@ -0,0 +1,65 @@
+"""Dense quantization checks for LocalMilvusStore, against a mocked Milvus client."""
+
+import pytest
+
+pymilvus = pytest.importorskip("pymilvus")
+
+from pymilvus import DataType, MilvusClient
+from pymilvus.client.prepare import Prepare
+from pymilvus.grpc_gen.common_pb2 import PlaceholderGroup, PlaceholderType
+
+from verbatim_rag.vector_stores import DENSE_QUANTIZATIONS, LocalMilvusStore
+
+# Placeholder type pymilvus must send for a query against each field type
+PLACEHOLDER_FOR_FIELD = {
+    DataType.FLOAT_VECTOR: PlaceholderType.FloatVector,
+    DataType.BINARY_VECTOR: PlaceholderType.BinaryVector,
+}
+
+
+class FakeMilvusClient:
+    """Records the collection schema and search requests instead of talking to Milvus."""
+
+    create_schema = staticmethod(MilvusClient.create_schema)
+    prepare_index_params = staticmethod(MilvusClient.prepare_index_params)
+
+    def __init__(self, uri):
+        self.schemas = {}
+        self.searches = []
+
+    def has_collection(self, collection_name):
+        return collection_name in self.schemas
+
+    def create_collection(self, collection_name, schema):
+        self.schemas[collection_name] = schema
+
+    def create_index(self, collection_name, index_params):
+        pass
+
+    def search(self, **kwargs):
+        self.searches.append(kwargs)
+        return [[]]
+
+
+@pytest.mark.parametrize("dense_quantization", DENSE_QUANTIZATIONS)
+def test_dense_query_placeholder_matches_field_type(monkeypatch, dense_quantization):
+    monkeypatch.setattr(pymilvus, "MilvusClient", FakeMilvusClient)
+    store = LocalMilvusStore(
+        collection_name="test",
+        dense_dim=16,
+        enable_dense=True,
+        enable_sparse=False,
+        dense_quantization=dense_quantization,
+    )
+
+    store.query(dense_query=[0.5, -0.25] * 8, top_k=3, search_type="dense")
+
+    fields = {f.name: f for f in store.client.schemas["test"].fields}
+    query_data = store.client.searches[-1]["data"]
+    placeholder = PlaceholderGroup.FromString(
+        Prepare._prepare_placeholder_str(query_data)
+    )
+    assert (
+        placeholder.placeholders[0].type
+        == (PLACEHOLDER_FOR_FIELD[fields["dense_vector"].dtype])
+    )
@@ -6,7 +6,9 @@ search results and constructs a complete QueryResponse with proper highlighting
 and citation numbering.
 """
 
+from bisect import bisect_left, insort
 from typing import List, Dict, Any, Set, Tuple
+
 from verbatim_core.models import (
     QueryResponse,
     DocumentWithHighlights,
@@ -15,6 +17,14 @@ from verbatim_core.models import (
     StructuredAnswer,
 )
 
+try:
+    import ahocorasick
+except ImportError:
+    ahocorasick = None
+
+# Below this many spans, per-span str.find beats building an automaton
+AHOCORASICK_MIN_SPANS = 4
+
 
 class ResponseBuilder:
     """
@@ -114,6 +124,13 @@ class ResponseBuilder:
         :param spans: List of text spans to highlight
         :return: List of Highlight objects
         """
+        if (
+            ahocorasick is not None
+            and len(spans) >= AHOCORASICK_MIN_SPANS
+            and all(spans)
+        ):
+            return self._create_highlights_automaton(doc_content, spans)
+
         highlights: List[Highlight] = []
         highlighted_regions: Set[Tuple[int, int]] = set()
 
@@ -137,6 +154,54 @@ class ResponseBuilder:
 
         return highlights
 
+    def _create_highlights_automaton(
+        self, doc_content: str, spans: List[str]
+    ) -> List[Highlight]:
+        """
+        Same result as _create_highlights, finding all spans in one pass.
+
+        An Aho-Corasick automaton yields every occurrence of every span in a
+        single scan of the document. Candidates are then accepted exactly as in
+        the per-span loop: spans in order, each span's occurrences left to right
+        without self-overlap, skipping any that overlap an accepted highlight.
+
+        :param doc_content: The full document text
+        :param spans: List of non-empty text spans to highlight
+        :return: List of Highlight objects
+        """
+        automaton = ahocorasick.Automaton()
+        for span in spans:
+            automaton.add_word(span, span)
+        automaton.make_automaton()
+
+        # Occurrences come out ordered by end index, i.e. by start per span
+        starts_by_span: Dict[str, List[int]] = {span: [] for span in spans}
+        for end_index, span in automaton.iter(doc_content):
+            starts_by_span[span].append(end_index - len(span) + 1)
+
+        highlights: List[Highlight] = []
+        # Accepted regions are disjoint, so sorted starts imply sorted ends
+        region_starts: List[int] = []
+        region_ends: List[int] = []
+
+        for span in spans:
+            span_len = len(span)
+            next_allowed = 0
+            for start in starts_by_span[span]:
+                if start < next_allowed:
+                    continue
+                end = start + span_len
+                next_allowed = end
+
+                idx = bisect_left(region_starts, end)
+                if idx > 0 and region_ends[idx - 1] > start:
+                    continue
+                highlights.append(Highlight(text=span, start=start, end=end))
+                insort(region_starts, start)
+                region_ends.insert(idx, end)
+
+        return highlights
+
     def _has_overlap(self, start: int, end: int, regions: Set[Tuple[int, int]]) -> bool:
         """
         Check if a text region overlaps with existing highlighted regions.
@@ -158,3 +158,45 @@ class SpladeProvider(SparseEmbeddingProvider):
 
     def get_dimension(self) -> int:
         return 30522  # BERT vocab size
+
+
+class QuantizedSparseProvider(SparseEmbeddingProvider):
+    """
+    Wraps a sparse provider and quantizes each vector's weights to uint8 levels.
+
+    Weights are scaled by the vector's max weight onto 0..levels and rounded;
+    terms that round to 0 are dropped, which prunes the long tail of tiny
+    SPLADE weights from the posting lists. The kept levels are scaled back by
+    ``w_max / levels`` so scores stay comparable across documents, since Milvus
+    only stores sparse vectors as float32 (SPARSE_FLOAT_VECTOR).
+    """
+
+    def __init__(self, provider: SparseEmbeddingProvider, levels: int = 255):
+        if not 1 <= levels <= 255:
+            raise ValueError("levels must be between 1 and 255")
+        self.provider = provider
+        self.levels = levels
+
+    def _quantize(self, sparse: Dict[int, float]) -> Dict[int, float]:
+        if not sparse:
+            return sparse
+        indices = np.fromiter(sparse.keys(), dtype=np.int64, count=len(sparse))
+        weights = np.fromiter(sparse.values(), dtype=np.float32, count=len(sparse))
+        w_max = float(np.abs(weights).max())
+        if w_max == 0.0:
+            return {}
+        q = np.clip(np.round(weights * self.levels / w_max), 0, self.levels).astype(
+            np.uint8
+        )
+        keep = np.nonzero(q)[0]
+        scale = w_max / self.levels
+        return {int(indices[i]): float(q[i]) * scale for i in keep}
+
+    def embed_text(self, text: str) -> Dict[int, float]:
+        return self._quantize(self.provider.embed_text(text))
+
+    def embed_batch(self, texts: List[str]) -> List[Dict[int, float]]:
+        return [self._quantize(s) for s in self.provider.embed_batch(texts)]
+
+    def get_dimension(self) -> int:
+        return self.provider.get_dimension()
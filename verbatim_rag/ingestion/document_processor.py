@@ -4,8 +4,11 @@ Simple document processing pipeline following the pattern in create_sample_index
 
 from typing import List, Optional, Dict, Any, Union
 from pathlib import Path
+import hashlib
+import os
 import re
 import unicodedata
+import uuid
 
 try:
     from docling.document_converter import DocumentConverter
@@ -21,15 +24,36 @@ from ..chunker_providers import ChunkerProvider, MarkdownChunkerProvider
 DEFAULT_MIN_CHUNK_SIZE = 300
 DEFAULT_MAX_CHUNK_SIZE = 1800
 
+# Bump when conversion/normalization output changes to invalidate cached text
+PROCESSOR_VERSION = 1
+
+
+def file_sha256(path: Union[str, Path]) -> str:
+    """Streaming SHA-256 of a file's bytes (1 MiB chunks)."""
+    h = hashlib.sha256()
+    with open(path, "rb") as f:
+        for chunk in iter(lambda: f.read(1 << 20), b""):
+            h.update(chunk)
+    return h.hexdigest()
+
 
 class DocumentProcessor:
     """
     Simple document processor using docling + chunker providers.
 
     Uses chunker_providers system for all text chunking operations.
+
+    If cache_dir is given, the converted text of local files is cached there,
+    keyed by file content hash and PROCESSOR_VERSION, so repeated runs skip
+    docling conversion. Chunking always runs, so chunker settings can change
+    freely between runs.
     """
 
-    def __init__(self, chunker_provider: Optional[ChunkerProvider] = None):
+    def __init__(
+        self,
+        chunker_provider: Optional[ChunkerProvider] = None,
+        cache_dir: Optional[Union[str, Path]] = None,
+    ):
         if not DOCLING_AVAILABLE:
             raise ImportError("docling is required. Install with: pip install docling")
 
@@ -38,6 +62,7 @@ class DocumentProcessor:
             min_chunk_size=DEFAULT_MIN_CHUNK_SIZE,
             max_chunk_size=DEFAULT_MAX_CHUNK_SIZE,
         )
+        self.cache_dir = Path(cache_dir) if cache_dir is not None else None
 
     def process_url(
         self, url: str, title: str, metadata: Optional[Dict[str, Any]] = None
@@ -99,6 +124,7 @@ class DocumentProcessor:
         file_path: Union[str, Path],
         title: Optional[str] = None,
         metadata: Optional[Dict[str, Any]] = None,
+        digest: Optional[str] = None,
     ) -> Document:
         """
         Process a local file.
@@ -107,6 +133,8 @@ class DocumentProcessor:
             file_path: Path to the file
             title: Optional title (defaults to filename)
             metadata: Optional metadata
+            digest: Optional precomputed file_sha256 of the file, used as the
+                cache key so the file isn't hashed again
 
         Returns:
             Processed Document with chunks
@@ -117,9 +145,8 @@ class DocumentProcessor:
             with open(file_path) as f:
                 content_md = f.read()
         else:
-            # Convert document using docling
-            result = self.converter.convert(file_path)
-            content_md = self._normalize_for_rag(result.document.export_to_markdown())
+            # Convert document using docling (or reuse cached conversion)
+            content_md = self._convert_file(file_path, digest)
 
         # Create Document
         document = Document(
@@ -225,9 +252,29 @@ class DocumentProcessor:
         Returns:
             Raw text content as markdown string
         """
-        file_path = Path(file_path)
+        return self._convert_file(Path(file_path))
+
+    def _convert_file(self, file_path: Path, digest: Optional[str] = None) -> str:
+        """Convert a local file to normalized markdown, using the cache if enabled."""
+        cache_path = None
+        if self.cache_dir is not None:
+            if digest is None:
+                digest = file_sha256(file_path)
+            cache_path = self.cache_dir / f"{digest}-v{PROCESSOR_VERSION}.md"
+            if cache_path.exists():
+                return cache_path.read_text(encoding="utf-8")
+
         result = self.converter.convert(file_path)
-        return self._normalize_for_rag(result.document.export_to_markdown())
+        content_md = self._normalize_for_rag(result.document.export_to_markdown())
+
+        if cache_path is not None:
+            # Write-then-rename so concurrent workers never see partial entries
+            self.cache_dir.mkdir(parents=True, exist_ok=True)
+            tmp = cache_path.with_name(f"{cache_path.name}.{uuid.uuid4().hex}.tmp")
+            tmp.write_text(content_md, encoding="utf-8")
+            os.replace(tmp, cache_path)
+
+        return content_md
 
     def _normalize_for_rag(self, text: str) -> str:
         """Normalize extracted text so retrieval/extraction/highlighting share stable text form."""
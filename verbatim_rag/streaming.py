@@ -5,12 +5,33 @@ Provides structured streaming of RAG processing stages
 
 from typing import AsyncGenerator, Dict, Any, List, Optional
 import asyncio
+import os
 import time
-from .models import (
-    DocumentWithHighlights,
-)
+import weakref
 from .core import VerbatimRAG
 
+# Max concurrent index queries across all streams (acts as a connection pool);
+# clamped to at least 1, since a zero-sized pool would block every query forever
+_QUERY_CONCURRENCY = max(1, int(os.getenv("VERBATIM_QUERY_CONCURRENCY", "4")))
+# Payload building for more documents than this runs in a worker thread
+_OFFLOAD_MIN_DOCS = 8
+# asyncio primitives belong to one event loop, so keep one semaphore per loop
+_query_semaphores = weakref.WeakKeyDictionary()
+
+
+def _query_semaphore() -> asyncio.Semaphore:
+    loop = asyncio.get_running_loop()
+    sem = _query_semaphores.get(loop)
+    if sem is None:
+        sem = _query_semaphores[loop] = asyncio.Semaphore(_QUERY_CONCURRENCY)
+    return sem
+
+
+async def _aquery(func, *args, **kwargs):
+    """Run a blocking index query in a worker thread, bounded by the query pool"""
+    async with _query_semaphore():
+        return await asyncio.to_thread(func, *args, **kwargs)
+
 
 class StreamingRAG:
     """
@@ -20,6 +41,41 @@ class StreamingRAG:
     def __init__(self, rag: VerbatimRAG):
         self.rag = rag
 
+    def _query_non_empty(self, question: str, k: int, filter: Optional[str]):
+        """
+        Query the index and drop documents without text
+
+        Returns:
+            Tuple of (non-empty documents, number of documents retrieved)
+        """
+        retrieved = self.rag.index.query(text=question, k=k, filter=filter)
+        docs = [
+            doc
+            for doc in retrieved
+            if isinstance(getattr(doc, "text", None), str) and doc.text.strip()
+        ]
+        return docs, len(retrieved)
+
+    def _highlight_payloads(
+        self, base_documents: List[Dict[str, Any]], span_by_idx: List[List[str]]
+    ) -> List[Dict[str, Any]]:
+        """Copies of the interim document dicts with highlights filled in"""
+        interim_documents = []
+        for base, doc_spans in zip(base_documents, span_by_idx):
+            if doc_spans:
+                highlights = self.rag.response_builder._create_highlights(
+                    base["content"], doc_spans
+                )
+            else:
+                highlights = []
+            interim = dict(base)
+            interim["highlights"] = [h.model_dump() for h in highlights]
+            interim_documents.append(interim)
+        return interim_documents
+
+    def _answer_payload(self, **build_kwargs) -> Dict[str, Any]:
+        return self.rag.response_builder.build_response(**build_kwargs).model_dump()
+
     async def stream_query(
         self, question: str, num_docs: int = None, filter: Optional[str] = None
     ) -> AsyncGenerator[Dict[str, Any], None]:
@@ -38,6 +94,7 @@ class StreamingRAG:
             Dictionary with type and data for each stage
         """
         original_k = self.rag.k
+        extraction_task = None
         try:
             # Set number of documents if specified
             if num_docs is not None:
@@ -45,30 +102,52 @@ class StreamingRAG:
 
             # Step 1: Retrieve documents and send them without highlights
             # Some backends can fail if k is too large for the current collection;
-            # if that happens, reduce k progressively until query succeeds.
-            docs = None
+            # if that happens, probe a ladder of smaller k values concurrently and
+            # keep the largest one that succeeds.
+            requested_k = max(1, self.rag.k)
+            retrieval = None
             last_query_error = None
-            for candidate_k in range(max(1, self.rag.k), 0, -1):
-                try:
-                    docs = self.rag.index.query(text=question, k=candidate_k, filter=filter)
-                    break
-                except Exception as e:
-                    last_query_error = e
-
-            if docs is None:
+            attempted_ks = {requested_k}
+            try:
+                retrieval = await _aquery(
+                    self._query_non_empty, question, requested_k, filter
+                )
+            except Exception as e:
+                last_query_error = e
+
+            if retrieval is None and requested_k > 1:
+                candidates = sorted(
+                    {
+                        requested_k >> shift
+                        for shift in range(1, requested_k.bit_length())
+                    }
+                )
+                attempted_ks.update(candidates)
+                results = await asyncio.gather(
+                    *(
+                        _aquery(self._query_non_empty, question, candidate_k, filter)
+                        for candidate_k in candidates
+                    ),
+                    return_exceptions=True,
+                )
+                for result in reversed(results):
+                    if isinstance(result, BaseException):
+                        last_query_error = result
+                    else:
+                        retrieval = result
+                        break
+
+            if retrieval is None:
                 yield {
                     "type": "error",
                     "error": f"retrieval_failed: {last_query_error}",
+                    "attempted_k": sorted(attempted_ks),
                     "done": True,
                 }
                 return
 
-            valid_docs = [
-                doc
-                for doc in docs
-                if isinstance(getattr(doc, "text", None), str) and doc.text.strip()
-            ]
-            dropped_docs = len(docs) - len(valid_docs)
+            docs, k_returned = retrieval
+            dropped_docs = k_returned - len(docs)
             if dropped_docs > 0:
                 yield {
                     "type": "progress",
@@ -76,7 +155,7 @@ class StreamingRAG:
                     "count": dropped_docs,
                 }
 
-            if not valid_docs:
+            if not docs:
                 yield {
                     "type": "error",
                     "error": "retrieval_failed: all retrieved documents were empty",
@@ -84,29 +163,34 @@ class StreamingRAG:
                 }
                 return
 
-            documents_without_highlights = [
-                DocumentWithHighlights(
-                    content=doc.text,
-                    highlights=[],
-                    title=doc.metadata.get("title", ""),
-                    source=doc.metadata.get("source", ""),
-                    metadata=doc.metadata,
-                )
-                for doc in valid_docs
+            # Start span extraction (a potentially slow, blocking LLM call) in a
+            # worker thread right away, so it overlaps with the documents yield
+            extraction_start = time.time()
+            extraction_task = asyncio.create_task(
+                asyncio.to_thread(self.rag.extractor.extract_spans, question, docs)
+            )
+
+            # Interim payloads are plain dicts in the DocumentWithHighlights shape;
+            # Pydantic validation happens once, in build_response for the answer
+            base_documents = [
+                {
+                    "content": doc.text,
+                    "highlights": [],
+                    "title": doc.metadata.get("title", ""),
+                    "source": doc.metadata.get("source", ""),
+                    "metadata": doc.metadata,
+                }
+                for doc in docs
             ]
 
             yield {
                 "type": "documents",
-                "data": [doc.model_dump() for doc in documents_without_highlights],
+                "data": base_documents,
             }
 
             # Step 2: Extract spans and create highlights (non-numbered for interim UI)
-            # Offload potentially blocking LLM extraction to a thread so we don't block the event loop
-            extraction_start = time.time()
             try:
-                relevant_spans = await asyncio.to_thread(
-                    self.rag.extractor.extract_spans, question, valid_docs
-                )
+                relevant_spans = await extraction_task
             except Exception as e:
                 yield {
                     "type": "error",
@@ -121,29 +205,23 @@ class StreamingRAG:
                 "stage": "extraction_complete",
                 "elapsed_ms": int(extraction_duration * 1000),
             }
-            interim_documents = []
-            for doc in valid_docs:
-                doc_content = doc.text
-                doc_spans = relevant_spans.get(doc_content, [])
-                if doc_spans:
-                    highlights = self.rag.response_builder._create_highlights(
-                        doc_content, doc_spans
-                    )
-                else:
-                    highlights = []
-                interim_documents.append(
-                    DocumentWithHighlights(
-                        content=doc_content,
-                        highlights=highlights,
-                        title=doc.metadata.get("title", ""),
-                        source=doc.metadata.get("source", ""),
-                        metadata=doc.metadata,
-                    )
+            # Spans are keyed by document text; resolve them to positions once
+            span_by_idx = [relevant_spans.get(doc.text, []) for doc in docs]
+
+            # Highlighting + serialization is CPU work; for larger payloads keep
+            # it off the event loop so concurrent streams stay responsive
+            if len(docs) > _OFFLOAD_MIN_DOCS:
+                interim_documents = await asyncio.to_thread(
+                    self._highlight_payloads, base_documents, span_by_idx
+                )
+            else:
+                interim_documents = self._highlight_payloads(
+                    base_documents, span_by_idx
                 )
 
             yield {
                 "type": "highlights",
-                "data": [d.model_dump() for d in interim_documents],
+                "data": interim_documents,
             }
 
             # Step 3: Generate answer using enhanced pipeline with new architecture
@@ -165,19 +243,35 @@ class StreamingRAG:
                     "done": True,
                 }
                 return
-            result = self.rag.response_builder.build_response(
+            build_kwargs = dict(
                 question=question,
                 answer=answer,
-                search_results=valid_docs,
+                search_results=docs,
                 relevant_spans=relevant_spans,
                 display_span_count=len(display_spans),
             )
+            if len(docs) > _OFFLOAD_MIN_DOCS:
+                answer_data = await asyncio.to_thread(
+                    self._answer_payload, **build_kwargs
+                )
+            else:
+                answer_data = self._answer_payload(**build_kwargs)
 
-            yield {"type": "answer", "data": result.model_dump(), "done": True}
+            yield {"type": "answer", "data": answer_data, "done": True}
 
         except Exception as e:
             yield {"type": "error", "error": str(e), "done": True}
         finally:
+            # If the consumer stopped early, detach the extraction task. cancel()
+            # does not stop the worker thread: the LLM call still runs to
+            # completion, its result is just discarded.
+            if extraction_task is not None:
+                if not extraction_task.done():
+                    extraction_task.cancel()
+                elif not extraction_task.cancelled():
+                    # Mark a failure as retrieved so asyncio doesn't log
+                    # "Task exception was never retrieved"
+                    extraction_task.exception()
             # Restore original k value even for early returns/errors
             self.rag.k = original_k
 
@@ -8,8 +8,12 @@ from dataclasses import dataclass
 import logging
 import json
 
+import numpy as np
+
 logger = logging.getLogger(__name__)
 
+DENSE_QUANTIZATIONS = ("fp32", "binary")
+
 
 @dataclass
 class SearchResult:
@@ -69,7 +73,24 @@ class LocalMilvusStore(VectorStore):
         enable_sparse: bool = True,
         index_type: str = "IVF_FLAT",
         nlist: int = 8192,
+        dense_quantization: str = "fp32",
+        binary_rescore_factor: int = 4,
     ):
+        """
+        :param dense_quantization: Storage format for dense vectors: "fp32" or
+            "binary" (1 bit per dimension, searched by Hamming distance and
+            rescored against the float query)
+        :param binary_rescore_factor: With binary dense vectors, how many times
+            top_k candidates to fetch by Hamming distance before rescoring
+        """
+        if dense_quantization not in DENSE_QUANTIZATIONS:
+            raise ValueError(
+                f"dense_quantization must be one of {DENSE_QUANTIZATIONS}, "
+                f"got {dense_quantization!r}"
+            )
+        if dense_quantization == "binary" and dense_dim % 8 != 0:
+            raise ValueError("Binary dense vectors require dense_dim divisible by 8")
+
         self.db_path = db_path
         self.collection_name = collection_name
         self.documents_collection_name = f"{collection_name}_documents"
@@ -78,6 +99,8 @@ class LocalMilvusStore(VectorStore):
         self.enable_sparse = enable_sparse
         self.index_type = index_type
         self.nlist = nlist
+        self.dense_quantization = dense_quantization
+        self.binary_rescore_factor = max(1, binary_rescore_factor)
 
         # Validate at least one embedding type is enabled
         if not enable_dense and not enable_sparse:
@@ -87,6 +110,61 @@ class LocalMilvusStore(VectorStore):
 
         self._setup_client()
 
+    def _encode_dense(self, vector: List[float]) -> Any:
+        """Convert a float vector into the configured dense storage format."""
+        if self.dense_quantization == "binary":
+            return np.packbits(np.asarray(vector, dtype=np.float32) > 0).tobytes()
+        return vector
+
+    def _dense_search(
+        self,
+        dense_query: List[float],
+        limit: int,
+        output_fields: List[str],
+        filter: Optional[str],
+        search_params: Optional[Dict[str, Any]],
+    ):
+        """Dense ANN search; binary vectors are overfetched and rescored."""
+        if self.dense_quantization != "binary":
+            return self.client.search(
+                collection_name=self.collection_name,
+                data=[self._encode_dense(dense_query)],
+                anns_field="dense_vector",
+                limit=limit,
+                output_fields=output_fields,
+                filter=filter,
+                search_params=search_params,
+            )
+
+        results = self.client.search(
+            collection_name=self.collection_name,
+            data=[self._encode_dense(dense_query)],
+            anns_field="dense_vector",
+            limit=limit * self.binary_rescore_factor,
+            output_fields=output_fields + ["dense_vector"],
+            filter=filter,
+            search_params=search_params,
+        )
+
+        # Asymmetric rescoring: float query against the +/-1 document codes
+        query = np.asarray(dense_query, dtype=np.float32)
+        rescored = []
+        for hit in results[0]:
+            entity = dict(hit.get("entity", {}))
+            code = entity.pop("dense_vector", None)
+            if isinstance(code, list):
+                code = code[0] if code else None
+            if code is None:
+                score = float("-inf")
+            else:
+                signs = np.unpackbits(np.frombuffer(code, dtype=np.uint8))
+                signs = signs[: query.size].astype(np.float32) * 2.0 - 1.0
+                score = float(query @ signs)
+            rescored.append({**hit, "entity": entity, "distance": score})
+
+        rescored.sort(key=lambda hit: hit["distance"], reverse=True)
+        return [rescored[:limit]]
+
     def _setup_client(self):
         try:
             from pymilvus import MilvusClient, DataType
@@ -110,9 +188,13 @@ class LocalMilvusStore(VectorStore):
                 )
                 # Add only the vector fields that are enabled
                 if self.enable_dense:
+                    dense_datatype = {
+                        "fp32": DataType.FLOAT_VECTOR,
+                        "binary": DataType.BINARY_VECTOR,
+                    }[self.dense_quantization]
                     schema.add_field(
                         field_name="dense_vector",
-                        datatype=DataType.FLOAT_VECTOR,
+                        datatype=dense_datatype,
                         dim=self.dense_dim,
                     )
 
@@ -144,7 +226,17 @@ class LocalMilvusStore(VectorStore):
                 # Create indexes for enabled vector fields
                 index_params = self.client.prepare_index_params()
 
-                if self.enable_dense:
+                if self.enable_dense and self.dense_quantization == "binary":
+                    # Binary dense vector index (Hamming distance)
+                    index_params.add_index(
+                        field_name="dense_vector",
+                        index_type="BIN_FLAT"
+                        if self.index_type == "FLAT"
+                        else "BIN_IVF_FLAT",
+                        metric_type="HAMMING",
+                        params={"nlist": self.nlist},
+                    )
+                elif self.enable_dense:
                     # Dense vector index
                     index_params.add_index(
                         field_name="dense_vector",
@@ -262,7 +354,7 @@ class LocalMilvusStore(VectorStore):
 
             # Add vectors only for fields that exist in the schema
             if self.enable_dense and dense_vectors:
-                item["dense_vector"] = dense_vectors[i]
+                item["dense_vector"] = self._encode_dense(dense_vectors[i])
             if self.enable_sparse and sparse_vectors:
                 item["sparse_vector"] = sparse_vectors[i]
 
@@ -392,14 +484,8 @@ class LocalMilvusStore(VectorStore):
 
         if search_type == "dense" and dense_query:
             # Dense vector search
-            results = self.client.search(
-                collection_name=self.collection_name,
-                data=[dense_query],
-                anns_field="dense_vector",
-                limit=top_k,
-                output_fields=output_fields,
-                filter=filter,
-                search_params=search_params,
+            results = self._dense_search(
+                dense_query, top_k, output_fields, filter, search_params
             )
 
         elif search_type == "sparse" and sparse_query:
@@ -420,14 +506,12 @@ class LocalMilvusStore(VectorStore):
             # by combining results from both dense and sparse searches
             try:
                 # Perform dense search
-                dense_results = self.client.search(
-                    collection_name=self.collection_name,
-                    data=[dense_query],
-                    anns_field="dense_vector",
-                    limit=top_k * 2,  # Get more results for merging
-                    output_fields=output_fields,
-                    filter=filter,
-                    search_params=search_params,
+                dense_results = self._dense_search(
+                    dense_query,
+                    top_k * 2,  # Get more results for merging
+                    output_fields,
+                    filter,
+                    search_params,
                 )
 
                 # Perform sparse search
@@ -452,14 +536,8 @@ class LocalMilvusStore(VectorStore):
                     f"Hybrid search failed: {e}, falling back to dense search"
                 )
                 # Fallback to dense search
-                results = self.client.search(
-                    collection_name=self.collection_name,
-                    data=[dense_query],
-                    anns_field="dense_vector",
-                    limit=top_k,
-                    output_fields=output_fields,
-                    filter=filter,
-                    search_params=search_params,
+                results = self._dense_search(
+                    dense_query, top_k, output_fields, filter, search_params
                 )
 
         else: